@@ -1,9 +1,16 @@
 """CelesTrak API client for fetching TLE data."""
 
+import itertools
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from tatc_mcp.validation import validate_norad_id, validate_tle_format
 
@@ -11,6 +18,39 @@ from tatc_mcp.validation import validate_norad_id, validate_tle_format
 SATCAT_URL = "https://celestrak.org/satcat/records.php"
 GP_TLE_URL = "https://celestrak.org/NORAD/elements/gp.php"
 GP_JSON_URL = "https://celestrak.org/NORAD/elements/gp.php"
+USER_AGENT = "tatc-mcp/1.0"
+
+# Transient CelesTrak failures (rate limiting, 5xx, dropped connections) are retried
+# with exponential backoff on the pooled connection. Once retries are exhausted the
+# final response is returned so raise_for_status() still reports the HTTP error.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False,
+)
+
+# Shared session so consecutive CelesTrak requests (e.g. a name search followed by a
+# TLE fetch) reuse pooled connections instead of paying a new TLS handshake each time.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount(
+    "https://", HTTPAdapter(max_retries=_RETRY, pool_connections=4, pool_maxsize=20)
+)
+
+# A streamed response closed before its end drops its pooled connection. Unread bodies up
+# to this many decoded bytes are drained so the connection can be reused; larger ones are
+# abandoned, since reading them would cost more than the new handshake it saves.
+MAX_DRAIN_BYTES = 1024 * 1024
+
+# Cache lifetimes in seconds. TLEs are refreshed by CelesTrak every few hours, while
+# name -> NORAD ID resolution and object names are effectively static.
+TLE_CACHE_TTL = 3600.0
+SEARCH_CACHE_TTL = 86400.0
+
+# CelesTrak reports unknown or decayed objects in plain text instead of an HTTP error.
+_TLE_ERROR_RE = re.compile(r"no gp data found|not found", re.IGNORECASE)
 
 # A few common colloquial names need explicit mapping because CelesTrak NAME search
 # is substring-based and can otherwise resolve to unrelated historical objects.
@@ -28,6 +68,59 @@ _COMMON_NAME_ALIASES = {
 }
 
 
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed lifetime."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+
+_TLE_CACHE = _TTLCache(maxsize=512, ttl=TLE_CACHE_TTL)
+_SEARCH_CACHE = _TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+_GP_METADATA_CACHE = _TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL)
+
+
+def clear_caches() -> None:
+    """Clear cached search results, GP metadata, and TLEs."""
+    _TLE_CACHE.clear()
+    _SEARCH_CACHE.clear()
+    _GP_METADATA_CACHE.clear()
+
+
+def close_session() -> None:
+    """Close pooled connections held by the shared CelesTrak session."""
+    _SESSION.close()
+
+
 def _normalize_name(value: str) -> str:
     """Normalize a name for case-insensitive matching."""
     return " ".join(re.sub(r"[^A-Za-z0-9]+", " ", value.upper()).split())
@@ -60,24 +153,44 @@ def _format_satcat_record(sat: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _drain_response(response: requests.Response) -> None:
+    """Read a small unread remainder of a streamed response so its connection is reused."""
+    remaining = MAX_DRAIN_BYTES
+    while remaining > 0:
+        chunk = response.raw.read(min(remaining, 65536))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+
+
 def _fetch_satcat_records(query: str, limit: int = 50) -> List[Dict[str, Any]]:
     """Fetch raw SATCAT records for a search query."""
-    response = requests.get(
+    records: List[Dict[str, Any]] = []
+    with _SESSION.get(
         SATCAT_URL,
         params={"NAME": query, "FORMAT": "json"},
+        stream=True,
         timeout=15,
-    )
-    response.raise_for_status()
-
-    data = _parse_json_response(response)
-    if not isinstance(data, list):
-        return []
+    ) as response:
+        response.raise_for_status()
+        # Let urllib3 undo any gzip/deflate encoding before ijson sees the bytes.
+        response.raw.decode_content = True
+
+        # Decode records incrementally and stop after `limit`, so broad queries never
+        # buffer or parse the full result set. Non-list payloads yield no items.
+        try:
+            for sat in itertools.islice(ijson.items(response.raw, "item", use_float=True), limit):
+                formatted = _format_satcat_record(sat)
+                if formatted is not None:
+                    records.append(formatted)
+        except ijson.IncompleteJSONError:
+            # An empty body means no matches; a truncated one is a real error.
+            if records:
+                raise
+        else:
+            # Stopping at `limit` leaves the rest of a broad query unread
+            _drain_response(response)
 
-    records: List[Dict[str, Any]] = []
-    for sat in data[:limit]:
-        formatted = _format_satcat_record(sat)
-        if formatted is not None:
-            records.append(formatted)
     return records
 
 
@@ -119,9 +232,14 @@ def _rank_search_results(query: str, results: List[Dict[str, Any]]) -> List[Dict
 
 def _fetch_gp_metadata(norad_id: int) -> Optional[Dict[str, Any]]:
     """Fetch current GP metadata for a NORAD ID."""
-    response = requests.get(
+    norad_id = validate_norad_id(norad_id)
+    cached = _GP_METADATA_CACHE.get(norad_id)
+    if cached is not None:
+        return dict(cached)
+
+    response = _SESSION.get(
         GP_JSON_URL,
-        params={"CATNR": validate_norad_id(norad_id), "FORMAT": "json"},
+        params={"CATNR": norad_id, "FORMAT": "json"},
         timeout=15,
     )
     response.raise_for_status()
@@ -129,11 +247,13 @@ def _fetch_gp_metadata(norad_id: int) -> Optional[Dict[str, Any]]:
     data = _parse_json_response(response)
     if isinstance(data, list) and data:
         item = data[0]
-        return {
+        metadata = {
             "norad_id": int(item.get("NORAD_CAT_ID", norad_id)),
             "name": item.get("OBJECT_NAME", "").strip(),
             "object_id": item.get("OBJECT_ID", "").strip(),
         }
+        _GP_METADATA_CACHE.set(norad_id, metadata)
+        return dict(metadata)
     return None
 
 
@@ -177,10 +297,17 @@ def search_satellites_by_name(query: str, limit: int = 10) -> List[Dict]:
     Returns:
         List of dictionaries with keys: norad_id, name, object_type, country, launch_date
     """
+    cache_key = (query, limit)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        return [dict(result) for result in cached]
+
     try:
         results = _fetch_satcat_records(query, limit=max(limit, 25))
-        ranked_results = _rank_search_results(query, results)
-        return ranked_results[:limit]
+        ranked_results = _rank_search_results(query, results)[:limit]
+        # Only successful lookups are cached; errors below must stay retryable.
+        _SEARCH_CACHE.set(cache_key, ranked_results)
+        return [dict(result) for result in ranked_results]
 
     except requests.RequestException:
         # Silently return empty list for network errors
@@ -235,35 +362,45 @@ def fetch_tle(norad_id: int) -> Tuple[str, str]:
     # Validate NORAD ID
     norad_id = validate_norad_id(norad_id)
 
+    cached = _TLE_CACHE.get(norad_id)
+    if cached is not None:
+        return cached
+
     # Don't use FORMAT=tle parameter - it causes 403 errors
     # The default format is TLE, so we don't need to specify it
     try:
-        response = requests.get(
+        with _SESSION.get(
             GP_TLE_URL,
             params={"CATNR": norad_id},
             allow_redirects=True,
+            stream=True,
             timeout=10,
-        )
-        response.raise_for_status()
+        ) as response:
+            response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = "utf-8"
+
+            # Only the name line and the two element lines are needed, so stop reading
+            # as soon as they arrive instead of buffering the whole body.
+            stripped = (
+                line.strip()
+                for line in response.iter_lines(chunk_size=1024, decode_unicode=True)
+            )
+            lines = list(itertools.islice(filter(None, stripped), 3))
 
         # Check if response is empty or indicates no data
-        response_text = response.text.strip()
+        response_text = "\n".join(lines)
         if not response_text:
             raise ValueError(f"No TLE data returned from CelesTrak for NORAD ID {norad_id}")
 
         # Check for common error messages from CelesTrak
-        if "No GP data found" in response_text or "not found" in response_text.lower():
+        if _TLE_ERROR_RE.search(response_text):
             raise ValueError(
                 f"TLE data not available for NORAD ID {norad_id}. "
                 f"The satellite may have decayed, been decommissioned, or the ID may be incorrect. "
                 f"Response: {response_text[:200]}"
             )
 
-        lines = response_text.split("\n")
-
-        # Filter out empty lines
-        lines = [line.strip() for line in lines if line.strip()]
-
         if len(lines) < 2:
             raise ValueError(
                 f"Invalid TLE format: expected at least 2 lines, got {len(lines)}. "
@@ -284,6 +421,7 @@ def fetch_tle(norad_id: int) -> Tuple[str, str]:
         # Validate TLE format
         line1, line2 = validate_tle_format(line1, line2)
 
+        _TLE_CACHE.set(norad_id, (line1, line2))
         return line1, line2
 
     except requests.Timeout:
@@ -325,19 +463,15 @@ def fetch_tle_by_name(satellite_name: str) -> Tuple[str, str]:
     return fetch_tle(norad_id)
 
 
-def get_satellite_info(satellite_identifier: str) -> Dict:
+def get_satellite_tle(satellite_identifier: str) -> Dict:
     """
-    Get satellite information including TLE data.
+    Resolve a satellite and fetch its TLE without looking up descriptive metadata.
 
     Args:
         satellite_identifier: Satellite name or NORAD ID
 
     Returns:
-        Dictionary with satellite information:
-        - norad_id: NORAD catalog number
-        - name: Satellite name (if available)
-        - tle_line1: First TLE line
-        - tle_line2: Second TLE line
+        Dictionary with norad_id, tle_line1 and tle_line2
     """
     norad_id = get_norad_id(satellite_identifier)
     if norad_id is None:
@@ -346,6 +480,29 @@ def get_satellite_info(satellite_identifier: str) -> Dict:
         )
 
     line1, line2 = fetch_tle(norad_id)
+    return {
+        "norad_id": norad_id,
+        "tle_line1": line1,
+        "tle_line2": line2,
+    }
+
+
+def get_satellite_info(satellite_identifier: str) -> Dict:
+    """
+    Get satellite information including TLE data.
+
+    Args:
+        satellite_identifier: Satellite name or NORAD ID
+
+    Returns:
+        Dictionary with satellite information:
+        - norad_id: NORAD catalog number
+        - name: Satellite name (if available)
+        - tle_line1: First TLE line
+        - tle_line2: Second TLE line
+    """
+    tle = get_satellite_tle(satellite_identifier)
+    norad_id = tle["norad_id"]
     metadata = _fetch_gp_metadata(norad_id)
 
     if metadata and metadata.get("name"):
@@ -363,6 +520,6 @@ def get_satellite_info(satellite_identifier: str) -> Dict:
     return {
         "norad_id": norad_id,
         "name": name,
-        "tle_line1": line1,
-        "tle_line2": line2,
+        "tle_line1": tle["tle_line1"],
+        "tle_line2": tle["tle_line2"],
     }
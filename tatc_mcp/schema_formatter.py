@@ -1,10 +1,23 @@
 """Format TAT-C outputs to match server telemetry format specification."""
 
+import itertools
+import logging
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 
+import numpy as np
+
+from tatc_mcp.tatc_integration import GroundTrack
 from tatc_mcp.validation import validate_coordinates as _validate_coordinates
 from tatc_mcp.validation import validate_altitude as _validate_altitude
+from tatc_mcp.validation import validate_coordinates_array
+
+logger = logging.getLogger(__name__)
+
+_UTC = timezone.utc
+# server telemetry format requires strict UTC timestamps with trailing Z.
+# The format has no fractional field, so microseconds are dropped by strftime itself.
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 
 def validate_coordinates(lat_deg: float, lon_deg: float) -> Tuple[float, float]:
@@ -34,14 +47,27 @@ def format_timestamp(time: datetime) -> str:
     Returns:
         ISO-8601 UTC string with trailing 'Z'
     """
-    if time.tzinfo is None:
-        time = time.replace(tzinfo=timezone.utc)
-    else:
-        time = time.astimezone(timezone.utc)
+    tz = time.tzinfo
+    if tz is None:
+        time = time.replace(tzinfo=_UTC)
+    elif tz is not _UTC:
+        time = time.astimezone(_UTC)
+
+    return time.strftime(_TIMESTAMP_FORMAT)
+
+
+def format_timestamps_array(times) -> List[str]:
+    """
+    Format many UTC times to ISO-8601 strings with trailing 'Z' in one vectorized call.
+
+    Args:
+        times: Array-like of numpy datetime64 values or naive UTC datetimes
 
-    # server telemetry format requires strict UTC timestamps with trailing Z.
-    time = time.replace(microsecond=0)
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ")
+    Returns:
+        List of ISO-8601 UTC strings, truncated to whole seconds like format_timestamp
+    """
+    times = np.asarray(times, dtype="datetime64[us]")
+    return np.datetime_as_string(times, unit="s", timezone="UTC").tolist()
 
 
 def format_position_lla(lat_deg: float, lon_deg: float, alt_m: float) -> Dict[str, float]:
@@ -66,20 +92,17 @@ def format_position_lla(lat_deg: float, lon_deg: float, alt_m: float) -> Dict[st
     }
 
 
-def format_footprint_geojson(coordinates: List[List[float]]) -> Optional[Dict[str, Any]]:
+def _validate_footprint_coordinates(coordinates) -> List[List[float]]:
     """
-    Format footprint coordinates as GeoJSON Feature<Polygon> per server telemetry format.
+    Validate and normalize footprint [lon, lat] pairs, dropping invalid vertices.
 
     Args:
-        coordinates: List of [lon, lat] coordinate pairs
+        coordinates: Sequence of [lon, lat] coordinate pairs
 
     Returns:
-        GeoJSON Feature<Polygon> dictionary, or None if coordinates are invalid
+        List of validated [lon, lat] pairs
     """
-    if not coordinates or len(coordinates) < 3:
-        return None
-
-    # Validate and normalize coordinates
+    # Footprints are only ~17 vertices, so a plain loop beats NumPy's per-array overhead
     validated_coords = []
     for coord in coordinates:
         if len(coord) < 2:
@@ -90,6 +113,32 @@ def format_footprint_geojson(coordinates: List[List[float]]) -> Optional[Dict[st
             validated_coords.append([lon, lat])
         except ValueError:
             continue
+    return validated_coords
+
+
+def format_footprint_geojson(
+    coordinates: List[List[float]], validated: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Format footprint coordinates as GeoJSON Feature<Polygon> per server telemetry format.
+
+    Args:
+        coordinates: List of [lon, lat] coordinate pairs
+        validated: Skip coordinate validation for polygons whose coordinates are already
+            in range, such as those produced by calculate_footprints_batch
+
+    Returns:
+        GeoJSON Feature<Polygon> dictionary, or None if coordinates are invalid
+    """
+    if coordinates is None or len(coordinates) < 3:
+        return None
+
+    if validated:
+        validated_coords = (
+            coordinates.tolist() if isinstance(coordinates, np.ndarray) else list(coordinates)
+        )
+    else:
+        validated_coords = _validate_footprint_coordinates(coordinates)
 
     if len(validated_coords) < 3:
         return None
@@ -110,19 +159,79 @@ def format_footprint_geojson(coordinates: List[List[float]]) -> Optional[Dict[st
     }
 
 
+def _format_trajectory_columns(
+    timestamps: List[str], lats, lons, alts
+) -> List[Dict[str, Any]]:
+    """
+    Build trajectory batch objects from column data validated in one vectorized pass.
+
+    Args:
+        timestamps: Formatted ISO-8601 UTC timestamps
+        lats: Array-like of latitudes in degrees
+        lons: Array-like of longitudes in degrees
+        alts: Array-like of altitudes in meters
+
+    Returns:
+        List of trajectory batch objects
+
+    Raises:
+        ValueError: If any point has invalid coordinates or altitude
+    """
+    lats, lons = validate_coordinates_array(lats, lons)
+    try:
+        alts = np.asarray(alts, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Altitudes must be numbers")
+
+    return [
+        {
+            "time": time,
+            "position_lla": {"lat_deg": lat_deg, "lon_deg": lon_deg, "alt_m": alt_m},
+        }
+        for time, lat_deg, lon_deg, alt_m in zip(
+            timestamps, lats.tolist(), lons.tolist(), alts.tolist()
+        )
+    ]
+
+
 def format_trajectory_batch(
-    ground_track: List[Tuple[datetime, float, float, float]]
+    ground_track: Union[GroundTrack, List[Tuple[datetime, float, float, float]]]
 ) -> List[Dict[str, Any]]:
     """
     Format ground track as trajectory_batches array per server telemetry format.
 
     Args:
-        ground_track: List of (time, lat_deg, lon_deg, alt_m) tuples
+        ground_track: GroundTrack or list of (time, lat_deg, lon_deg, alt_m) tuples
 
     Returns:
         List of trajectory batch objects
     """
+    if isinstance(ground_track, GroundTrack):
+        columns = [
+            format_timestamps_array(ground_track.times),
+            ground_track.lat,
+            ground_track.lon,
+            ground_track.alt,
+        ]
+    else:
+        # Transpose legacy tuples into columns so they share the vectorized path
+        ground_track = list(ground_track)
+        if not ground_track:
+            return []
+        columns = list(zip(*ground_track))
+        if len(columns) == 4:
+            columns[0] = [format_timestamp(time) for time in columns[0]]
+
+    # Validate the whole track at once; only if it contains invalid points fall
+    # through to the per-point path, which skips them individually.
+    if len(columns) == 4:
+        try:
+            return _format_trajectory_columns(*columns)
+        except ValueError:
+            pass
+
     batches = []
+    skipped = []
     for time, lat_deg, lon_deg, alt_m in ground_track:
         try:
             batches.append(
@@ -133,9 +242,14 @@ def format_trajectory_batch(
             )
         except ValueError as e:
             # Skip invalid coordinates
-            print(f"Warning: Skipping invalid trajectory point: {e}")
+            skipped.append(e)
             continue
 
+    if skipped:
+        logger.warning(
+            "Skipped %d invalid trajectory point(s) (first: %s)", len(skipped), skipped[0]
+        )
+
     return batches
 
 
@@ -147,6 +261,7 @@ def format_telemetry_message(
     trajectory_batches: Optional[List[Tuple[datetime, float, float, float]]] = None,
     lookpoint_lla: Optional[Tuple[float, float, float]] = None,
     state_flags: Optional[List[str]] = None,
+    footprint_validated: bool = False,
 ) -> Dict[str, Any]:
     """
     Format a complete telemetry message per server telemetry format.
@@ -159,6 +274,7 @@ def format_telemetry_message(
         trajectory_batches: Optional ground track data
         lookpoint_lla: Optional boresight target (lat_deg, lon_deg, alt_m)
         state_flags: Optional list of state flag strings
+        footprint_validated: Whether footprint_coords are already validated and normalized
 
     Returns:
         Dictionary matching the server telemetry format
@@ -182,7 +298,9 @@ def format_telemetry_message(
 
     # Add optional footprint_geojson
     if footprint_coords is not None:
-        footprint_geojson = format_footprint_geojson(footprint_coords)
+        footprint_geojson = format_footprint_geojson(
+            footprint_coords, validated=footprint_validated
+        )
         if footprint_geojson is not None:
             message["footprint_geojson"] = footprint_geojson
 
@@ -197,23 +315,96 @@ def format_telemetry_message(
     return message
 
 
+def _format_ground_track_columns(
+    satellite_id: str,
+    ground_track: GroundTrack,
+    footprints: Optional[List[Optional[List[List[float]]]]],
+    footprints_validated: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Build telemetry messages for a whole GroundTrack in a single fused pass.
+
+    Produces the same messages as calling format_telemetry_message per point, but
+    validates coordinates and formats timestamps once for the whole track.
+
+    Args:
+        satellite_id: Stable satellite/platform identifier
+        ground_track: GroundTrack to format
+        footprints: Optional list of footprint coordinates (one per ground track point)
+        footprints_validated: Whether footprints are already validated and normalized
+
+    Returns:
+        List of telemetry message dictionaries
+
+    Raises:
+        ValueError: If satellite_id is empty or any point has invalid coordinates
+    """
+    if not satellite_id or not satellite_id.strip():
+        raise ValueError("satellite_id must be a non-empty string")
+    satellite_id = str(satellite_id).strip()
+
+    lats, lons = validate_coordinates_array(ground_track.lat, ground_track.lon)
+    alts = np.asarray(ground_track.alt, dtype=np.float64)
+    # Points beyond the end of footprints get no footprint, as in the per-point path
+    footprints = itertools.chain(
+        footprints if footprints is not None else (), itertools.repeat(None)
+    )
+
+    messages = []
+    append_message = messages.append
+    for time, lat_deg, lon_deg, alt_m, footprint_coords in zip(
+        format_timestamps_array(ground_track.times),
+        lats.tolist(),
+        lons.tolist(),
+        alts.tolist(),
+        footprints,
+    ):
+        message = {
+            "id": satellite_id,
+            "time": time,
+            "position_lla": {"lat_deg": lat_deg, "lon_deg": lon_deg, "alt_m": alt_m},
+        }
+        if footprint_coords is not None:
+            footprint_geojson = format_footprint_geojson(
+                footprint_coords, validated=footprints_validated
+            )
+            if footprint_geojson is not None:
+                message["footprint_geojson"] = footprint_geojson
+        append_message(message)
+
+    return messages
+
+
 def format_ground_track_response(
     satellite_id: str,
-    ground_track: List[Tuple[datetime, float, float, float]],
+    ground_track: Union[GroundTrack, List[Tuple[datetime, float, float, float]]],
     footprints: Optional[List[Optional[List[List[float]]]]] = None,
+    footprints_validated: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Format a complete ground track response as an array of telemetry messages.
 
     Args:
         satellite_id: Stable satellite/platform identifier
-        ground_track: List of (time, lat_deg, lon_deg, alt_m) tuples
+        ground_track: GroundTrack or list of (time, lat_deg, lon_deg, alt_m) tuples
         footprints: Optional list of footprint coordinates (one per ground track point)
+        footprints_validated: Whether footprints are already validated and normalized
 
     Returns:
         List of telemetry message dictionaries
     """
+    if isinstance(ground_track, GroundTrack):
+        # Validate the whole track at once; only if it contains invalid points fall
+        # through to the per-point path, which skips them individually.
+        try:
+            return _format_ground_track_columns(
+                satellite_id, ground_track, footprints, footprints_validated
+            )
+        except ValueError:
+            pass
+
     messages = []
+    skipped = []
 
     for i, (time, lat_deg, lon_deg, alt_m) in enumerate(ground_track):
         footprint_coords = None
@@ -226,11 +417,21 @@ def format_ground_track_response(
                 time=time,
                 position_lla=(lat_deg, lon_deg, alt_m),
                 footprint_coords=footprint_coords,
+                footprint_validated=footprints_validated,
             )
             messages.append(message)
         except ValueError as e:
-            print(f"Warning: Skipping invalid telemetry point at {time}: {e}")
+            skipped.append((time, e))
             continue
 
+    if skipped:
+        first_time, first_error = skipped[0]
+        logger.warning(
+            "Skipped %d invalid telemetry point(s) (first at %s: %s)",
+            len(skipped),
+            first_time,
+            first_error,
+        )
+
     return messages
 
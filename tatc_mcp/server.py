@@ -1,12 +1,16 @@
 """MCP server for satellite ground track generation using TAT-C."""
 
 import asyncio
-import json
+import functools
+import inspect
+import re
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, List, Dict, Callable
+from typing import Any, Awaitable, Optional, List, Dict, Callable, Tuple
 
 from dateutil import parser as date_parser
+import numpy as np
+import orjson
 
 try:
     from mcp.server import Server
@@ -16,18 +20,31 @@ except ImportError:
     print("Error: MCP SDK is not installed. Install with: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
-from tatc_mcp.celestrak_client import get_satellite_info, search_satellites_by_name
+from tatc_mcp.celestrak_client import (
+    close_session,
+    get_satellite_info,
+    get_satellite_tle,
+    search_satellites_by_name,
+)
 from tatc_mcp.tatc_integration import (
     create_satellite_from_tle,
     generate_ground_track,
-    calculate_footprint_from_position,
+    calculate_footprints_batch,
 )
 from tatc_mcp.schema_formatter import format_ground_track_response
 from tatc_mcp.validation import validate_time_range, validate_step_interval
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = None
+
 # Initialize server
 server = Server("tatc-mcp-server")
 
+# Upper bound on concurrent CelesTrak lookups issued by one bulk request
+MAX_CONCURRENT_LOOKUPS = 8
+
 
 # Time parsing utilities
 # Time unit normalization mapping
@@ -44,14 +61,21 @@ _TIME_UNITS = {
     "day": "days",
 }
 
-# Time unit to timedelta parameter mapping
-_UNIT_TO_DELTA = {
-    "seconds": lambda amount: timedelta(seconds=amount),
-    "minutes": lambda amount: timedelta(minutes=amount),
-    "hours": lambda amount: timedelta(hours=amount),
-    "days": lambda amount: timedelta(days=amount),
+# Seconds per normalized time unit
+_UNIT_SECONDS = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
 }
 
+# "<amount> <unit>" where the amount is a float literal with optional sign and exponent
+# (space optional, e.g. "10sec", "1e3 seconds") or spelled out in words (e.g.
+# "twenty-five minutes", "an hour")
+_AMOUNT_UNIT_RE = re.compile(
+    r"^(?:([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?)\s*|([a-z][a-z\s-]*?)\s+)([a-z]+)$"
+)
+
 _WORD_NUMBERS = {
     "a": 1,
     "an": 1,
@@ -86,17 +110,22 @@ _WORD_NUMBERS = {
 }
 
 
+def _utcnow() -> datetime:
+    """Return the current time as a naive UTC datetime."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def _parse_time_unit(unit: str) -> Optional[str]:
     """Normalize time unit string."""
-    return _TIME_UNITS.get(unit.lower(), unit.lower() if unit.lower() in _UNIT_TO_DELTA else None)
+    return _TIME_UNITS.get(unit.lower(), unit.lower() if unit.lower() in _UNIT_SECONDS else None)
 
 
 def _unit_to_timedelta(unit: str, amount: float) -> timedelta:
     """Convert normalized unit and amount to timedelta."""
-    converter = _UNIT_TO_DELTA.get(unit)
-    if not converter:
+    try:
+        return timedelta(seconds=amount * _UNIT_SECONDS[unit])
+    except KeyError:
         raise ValueError(f"Unknown time unit: {unit}")
-    return converter(amount)
 
 
 def _parse_amount_phrase(amount_str: str) -> float:
@@ -119,24 +148,44 @@ def _parse_amount_phrase(amount_str: str) -> float:
     return float(total)
 
 
+def _parse_amount_unit(text: str) -> Tuple[float, str]:
+    """Split an '<amount> <unit>' phrase into a numeric amount and normalized unit."""
+    match = _AMOUNT_UNIT_RE.match(text)
+    if not match:
+        raise ValueError("Expected an amount followed by a time unit")
+
+    number, words, unit_str = match.groups()
+    unit = _parse_time_unit(unit_str)
+    if not unit:
+        raise ValueError(f"Unknown time unit: {unit_str}")
+
+    amount = _parse_amount_phrase(number if number is not None else words)
+    return amount, unit
+
+
 def _parse_relative_time(time_str: str) -> Optional[datetime]:
     """Parse relative time expressions like 'in 1 hour' or 'in one hour'."""
     if not time_str.startswith("in "):
         return None
 
     try:
-        parts = time_str[3:].split()
-        if len(parts) < 2:
-            return None
+        amount, unit = _parse_amount_unit(time_str[3:].lstrip())
+        return _utcnow() + _unit_to_timedelta(unit, amount)
+    except ValueError:
+        return None
 
-        amount = _parse_amount_phrase(" ".join(parts[:-1]))
-        unit = _parse_time_unit(parts[-1])
-        if not unit:
-            return None
 
-        return datetime.utcnow() + _unit_to_timedelta(unit, amount)
-    except (ValueError, IndexError):
-        return None
+def _to_naive_utc(dt: datetime) -> datetime:
+    """Convert a datetime to naive UTC, treating naive input as already UTC."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_datetime_cached(time_str: str, default: datetime) -> datetime:
+    """Parse a date/time string with dateutil and return it as naive UTC (memoized)."""
+    return _to_naive_utc(date_parser.parse(time_str, default=default))
 
 
 def parse_time_input(time_str: str) -> datetime:
@@ -157,21 +206,26 @@ def parse_time_input(time_str: str) -> datetime:
     time_str = time_str.strip().lower()
 
     if time_str in ("now", "current"):
-        return datetime.utcnow()
+        return _utcnow()
 
     # Try relative time parsing
     relative = _parse_relative_time(time_str)
     if relative:
         return relative
 
-    # Use dateutil for more complex parsing
+    # Fast path for full ISO-8601 dates when the optional ciso8601 extension is present.
+    # Shorter inputs like "2024-01" fall through so dateutil's defaults still apply.
+    if _parse_iso8601 is not None and len(time_str) >= 10:
+        try:
+            return _to_naive_utc(_parse_iso8601(time_str))
+        except ValueError:
+            pass
+
+    # Use dateutil for more complex parsing. The default date fills in missing fields
+    # (e.g. "10:00"), so it is part of the cache key to keep such inputs current.
     try:
-        dt = date_parser.parse(time_str)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-        return dt.replace(tzinfo=None)  # Return naive UTC for compatibility
+        default = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return _parse_datetime_cached(time_str, default)  # Naive UTC for compatibility
     except Exception as e:
         raise ValueError(f"Could not parse time string '{time_str}': {e}")
 
@@ -196,20 +250,39 @@ def parse_duration(duration_str: str) -> timedelta:
 
     # Parse with units
     try:
-        parts = duration_str.split()
-        if len(parts) < 2:
-            raise ValueError("Duration must include a unit")
-
-        amount = _parse_amount_phrase(" ".join(parts[:-1]))
-        unit = _parse_time_unit(parts[-1])
-        if not unit:
-            raise ValueError(f"Unknown time unit: {parts[-1]}")
-
+        amount, unit = _parse_amount_unit(duration_str)
         return _unit_to_timedelta(unit, amount)
-    except (ValueError, IndexError) as e:
+    except ValueError as e:
         raise ValueError(f"Could not parse duration string '{duration_str}': {e}")
 
 
+async def _run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call in the default executor so the event loop stays responsive."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def _compute_ground_track(
+    sat_info: Dict[str, Any],
+    start_time: datetime,
+    end_time: datetime,
+    step_seconds: float,
+) -> List[Dict[str, Any]]:
+    """Propagate a satellite and format its ground track (CPU-bound, runs off-loop)."""
+    satellite = create_satellite_from_tle(sat_info["tle_line1"], sat_info["tle_line2"])
+    ground_track = generate_ground_track(satellite, start_time, end_time, step_seconds)
+    footprints = calculate_footprints_batch(ground_track.lat, ground_track.lon, ground_track.alt)
+    # Batch polygons are already clamped and normalized; only the NaN rows for
+    # footprints that cannot be computed need dropping before formatting.
+    finite = np.isfinite(footprints).all(axis=(1, 2)).tolist()
+    footprints = [
+        polygon if ok else None for polygon, ok in zip(footprints.tolist(), finite)
+    ]
+    return format_ground_track_response(
+        str(sat_info["norad_id"]), ground_track, footprints, footprints_validated=True
+    )
+
+
 async def handle_generate_ground_track(
     satellite_identifier: str,
     start_time: Optional[str] = None,
@@ -229,7 +302,7 @@ async def handle_generate_ground_track(
         List of telemetry messages in the server telemetry format
     """
     # Parse parameters with defaults
-    start_time_dt = datetime.utcnow() if start_time is None else parse_time_input(start_time)
+    start_time_dt = _utcnow() if start_time is None else parse_time_input(start_time)
     duration_delta = timedelta(hours=1) if duration is None else parse_duration(duration)
     step_seconds = 60.0 if step_interval is None else parse_duration(step_interval).total_seconds()
 
@@ -239,19 +312,13 @@ async def handle_generate_ground_track(
     start_time_dt, end_time_dt = validate_time_range(start_time_dt, end_time_dt)
     step_seconds = validate_step_interval(step_seconds)
 
-    # Get satellite info
-    sat_info = get_satellite_info(satellite_identifier)
+    # Only the NORAD ID and TLE are needed here, so skip the GP metadata lookup
+    sat_info = await _run_blocking(get_satellite_tle, satellite_identifier)
 
-    # Generate ground track
-    satellite = create_satellite_from_tle(sat_info["tle_line1"], sat_info["tle_line2"])
-    ground_track = generate_ground_track(satellite, start_time_dt, end_time_dt, step_seconds)
-    footprints = [
-        calculate_footprint_from_position(lat_deg, lon_deg, alt_m)
-        for _, lat_deg, lon_deg, alt_m in ground_track
-    ]
-
-    # Format response
-    return format_ground_track_response(str(sat_info["norad_id"]), ground_track, footprints)
+    # Generate and format ground track
+    return await _run_blocking(
+        _compute_ground_track, sat_info, start_time_dt, end_time_dt, step_seconds
+    )
 
 
 async def handle_get_satellite_info(satellite_identifier: str) -> Dict[str, Any]:
@@ -264,7 +331,7 @@ async def handle_get_satellite_info(satellite_identifier: str) -> Dict[str, Any]
     Returns:
         Dictionary with satellite information
     """
-    info = get_satellite_info(satellite_identifier)
+    info = await _run_blocking(get_satellite_info, satellite_identifier)
     return {
         "norad_id": info["norad_id"],
         "name": info["name"],
@@ -273,6 +340,50 @@ async def handle_get_satellite_info(satellite_identifier: str) -> Dict[str, Any]
     }
 
 
+async def handle_bulk_get_satellite_info(
+    satellite_identifiers: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Get satellite information for several satellites concurrently.
+
+    Args:
+        satellite_identifiers: Satellite names or NORAD IDs
+
+    Returns:
+        One entry per identifier, in order. Failed lookups are reported as
+        dictionaries with satellite_identifier and error keys.
+
+    Raises:
+        ValueError: If satellite_identifiers is not a list
+    """
+    # A bare string would otherwise be iterated character by character
+    if not isinstance(satellite_identifiers, list):
+        raise ValueError(
+            f"satellite_identifiers must be a list, got {type(satellite_identifiers).__name__}"
+        )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+    async def lookup(identifier: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await handle_get_satellite_info(identifier)
+
+    results = await asyncio.gather(
+        *(lookup(identifier) for identifier in satellite_identifiers),
+        return_exceptions=True,
+    )
+
+    entries = []
+    for identifier, result in zip(satellite_identifiers, results):
+        if isinstance(result, Exception):
+            entries.append({"satellite_identifier": identifier, "error": str(result)})
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            entries.append(result)
+    return entries
+
+
 async def handle_search_satellites(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
     Search for satellites by name.
@@ -284,136 +395,167 @@ async def handle_search_satellites(query: str, limit: int = 10) -> List[Dict[str
     Returns:
         List of satellite dictionaries with NORAD ID, name, and metadata
     """
-    return search_satellites_by_name(query, limit=limit)
+    return await _run_blocking(search_satellites_by_name, query, limit=limit)
 
 
-def _format_result(result: Any) -> List[TextContent]:
-    """Format result as JSON TextContent."""
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+# Tool name to handler mapping; tool arguments map directly onto handler keyword arguments
+_HANDLERS: Dict[str, Callable[..., Awaitable[Any]]] = {
+    "generate_ground_track": handle_generate_ground_track,
+    "get_satellite_info": handle_get_satellite_info,
+    "bulk_get_satellite_info": handle_bulk_get_satellite_info,
+    "search_satellites": handle_search_satellites,
+}
 
+# Keyword arguments accepted by each handler, used to drop unexpected client arguments
+_HANDLER_PARAMS = {
+    name: frozenset(inspect.signature(handler).parameters) for name, handler in _HANDLERS.items()
+}
 
-# Register tools
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available tools."""
-    tools = [
-        Tool(
-            name="generate_ground_track",
-            description=(
-                "Generate ground track for a satellite over a specified time period with configurable time steps. "
-                "CRITICAL: When user mentions time steps (e.g., '10 second steps', 'every 30 seconds', '1 minute intervals', '10 sec time step'), "
-                "you MUST extract and include the step_interval parameter. Examples: "
-                "User says '10 second time steps' -> step_interval='10 seconds', "
-                "User says 'every 30 sec' -> step_interval='30 sec', "
-                "User says '1 minute steps' -> step_interval='1 minute'. "
-                "Time steps can be in seconds ('10 seconds', '30 sec'), minutes ('1 minute', '5 mins'), or hours. "
-                "If user does NOT mention time steps, default is '1 minute'. "
-                "Supports start times like 'now', ISO-8601 timestamps, or relative phrases like 'in one hour'. "
-                "Returns telemetry data in the server telemetry format, including optional footprint geometry when available."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "satellite_identifier": {
-                        "type": "string",
-                        "description": "Satellite name (e.g., 'ISS', 'Hubble') or NORAD ID",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time (ISO-8601 or 'now', default: now)",
-                    },
-                    "duration": {
-                        "type": "string",
-                        "description": "Duration (e.g., '1 hour', '60 minutes', default: 1 hour)",
-                    },
-                    "step_interval": {
-                        "type": "string",
-                        "description": (
-                            "REQUIRED when user specifies a time step. Time step interval between data points. "
-                            "Supports: seconds ('10 seconds', '30 sec', '10 sec'), minutes ('1 minute', '5 mins', '1 min'), or hours ('1 hour'). "
-                            "Examples: '10 seconds', '30 sec', '1 minute', '5 mins', '1 hour'. "
-                            "If user says '10 second time step' or 'every 10 seconds', use '10 seconds'. "
-                            "If user says '1 minute steps' or 'every minute', use '1 minute'. "
-                            "Default: '1 minute' only if user does not specify any time step."
-                        ),
-                    },
+
+def _format_result(result: Any, pretty: bool = False) -> List[TextContent]:
+    """
+    Format result as JSON TextContent.
+
+    Output is compact by default since tool results are consumed by LLM clients;
+    pass pretty=True for human-readable, indented JSON.
+    """
+    option = orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return [TextContent(type="text", text=orjson.dumps(result, option=option).decode())]
+
+
+# Tool definitions are static, so build them once instead of on every list_tools call
+_TOOLS: List[Tool] = [
+    Tool(
+        name="generate_ground_track",
+        description=(
+            "Generate ground track for a satellite over a specified time period with configurable time steps. "
+            "CRITICAL: When user mentions time steps (e.g., '10 second steps', 'every 30 seconds', '1 minute intervals', '10 sec time step'), "
+            "you MUST extract and include the step_interval parameter. Examples: "
+            "User says '10 second time steps' -> step_interval='10 seconds', "
+            "User says 'every 30 sec' -> step_interval='30 sec', "
+            "User says '1 minute steps' -> step_interval='1 minute'. "
+            "Time steps can be in seconds ('10 seconds', '30 sec'), minutes ('1 minute', '5 mins'), or hours. "
+            "If user does NOT mention time steps, default is '1 minute'. "
+            "Supports start times like 'now', ISO-8601 timestamps, or relative phrases like 'in one hour'. "
+            "Returns telemetry data in the server telemetry format, including optional footprint geometry when available."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "satellite_identifier": {
+                    "type": "string",
+                    "description": "Satellite name (e.g., 'ISS', 'Hubble') or NORAD ID",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "Start time (ISO-8601 or 'now', default: now)",
+                },
+                "duration": {
+                    "type": "string",
+                    "description": "Duration (e.g., '1 hour', '60 minutes', default: 1 hour)",
+                },
+                "step_interval": {
+                    "type": "string",
+                    "description": (
+                        "REQUIRED when user specifies a time step. Time step interval between data points. "
+                        "Supports: seconds ('10 seconds', '30 sec', '10 sec'), minutes ('1 minute', '5 mins', '1 min'), or hours ('1 hour'). "
+                        "Examples: '10 seconds', '30 sec', '1 minute', '5 mins', '1 hour'. "
+                        "If user says '10 second time step' or 'every 10 seconds', use '10 seconds'. "
+                        "If user says '1 minute steps' or 'every minute', use '1 minute'. "
+                        "Default: '1 minute' only if user does not specify any time step."
+                    ),
                 },
-                "required": ["satellite_identifier"],
             },
+            "required": ["satellite_identifier"],
+        },
+    ),
+    Tool(
+        name="get_satellite_info",
+        description="Get satellite information including TLE data from CelesTrak.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "satellite_identifier": {
+                    "type": "string",
+                    "description": "Satellite name (e.g., 'ISS') or NORAD ID",
+                }
+            },
+            "required": ["satellite_identifier"],
+        },
+    ),
+    Tool(
+        name="bulk_get_satellite_info",
+        description=(
+            "Get satellite information including TLE data for several satellites at once. "
+            "Lookups run concurrently; failures are reported per satellite."
         ),
-        Tool(
-            name="get_satellite_info",
-            description="Get satellite information including TLE data from CelesTrak.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "satellite_identifier": {
-                        "type": "string",
-                        "description": "Satellite name (e.g., 'ISS') or NORAD ID",
-                    }
-                },
-                "required": ["satellite_identifier"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "satellite_identifiers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Satellite names (e.g., 'ISS') or NORAD IDs",
+                }
             },
+            "required": ["satellite_identifiers"],
+        },
+    ),
+    Tool(
+        name="search_satellites",
+        description=(
+            "Search for satellites by name in the CelesTrak database. "
+            "Useful when you don't know the exact satellite name or NORAD ID. "
+            "Returns a list of matching satellites with their NORAD IDs."
         ),
-        Tool(
-            name="search_satellites",
-            description=(
-                "Search for satellites by name in the CelesTrak database. "
-                "Useful when you don't know the exact satellite name or NORAD ID. "
-                "Returns a list of matching satellites with their NORAD IDs."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Satellite name or partial name to search for (e.g., 'Starlink', 'NOAA', 'Hubble', 'ISS')",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (default: 10, max recommended: 50)",
-                        "default": 10,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Satellite name or partial name to search for (e.g., 'Starlink', 'NOAA', 'Hubble', 'ISS')",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return (default: 10, max recommended: 50)",
+                    "default": 10,
                 },
-                "required": ["query"],
             },
-        ),
-    ]
+            "required": ["query"],
+        },
+    ),
+]
+
 
-    return tools
+# Register tools
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available tools."""
+    return _TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool calls."""
-    handlers: Dict[str, Callable[[], Any]] = {
-        "generate_ground_track": lambda: handle_generate_ground_track(
-            satellite_identifier=arguments.get("satellite_identifier"),
-            start_time=arguments.get("start_time"),
-            duration=arguments.get("duration"),
-            step_interval=arguments.get("step_interval"),
-        ),
-        "get_satellite_info": lambda: handle_get_satellite_info(
-            satellite_identifier=arguments.get("satellite_identifier")
-        ),
-        "search_satellites": lambda: handle_search_satellites(
-            query=arguments.get("query"),
-            limit=arguments.get("limit", 10),
-        ),
-    }
-
-    handler = handlers.get(name)
+    handler = _HANDLERS.get(name)
     if not handler:
         raise ValueError(f"Unknown tool: {name}")
 
-    result = await handler()
+    params = _HANDLER_PARAMS[name]
+    kwargs = {key: value for key, value in (arguments or {}).items() if key in params}
+    result = await handler(**kwargs)
     return _format_result(result)
 
 
 # Run MCP server
 if __name__ == "__main__":
     async def run_server():
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(read_stream, write_stream, server.create_initialization_options())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, server.create_initialization_options())
+        finally:
+            close_session()
 
     asyncio.run(run_server())
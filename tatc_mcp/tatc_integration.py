@@ -1,16 +1,31 @@
 """TAT-C library integration for satellite operations."""
 
+import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Iterator, List, Tuple, Optional, Dict, Any
 import math
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 # Constants
 DEFAULT_STEP_SECONDS = 60.0  # Default time step for ground track generation
 DEFAULT_FOV_DEGREES = 60.0  # Default field of view for footprint calculation
 FOOTPRINT_POLYGON_POINTS = 16  # Number of points in circular footprint polygon
 EARTH_RADIUS_M = 6371000.0  # Earth radius in meters for footprint calculations
 
+# Polygon vertex angles around the footprint center (last vertex closes the ring),
+# with their cosines and sines precomputed since they are identical for every footprint
+_FOOTPRINT_ANGLES = np.linspace(0.0, 2.0 * math.pi, FOOTPRINT_POLYGON_POINTS + 1)
+_FOOTPRINT_COS = np.cos(_FOOTPRINT_ANGLES)
+_FOOTPRINT_SIN = np.sin(_FOOTPRINT_ANGLES)
+
+_UTC = timezone.utc
+
 try:
+    from tatc import constants as tatc_constants
     from tatc.schemas import TwoLineElements
     from skyfield.api import wgs84
 
@@ -19,12 +34,70 @@ except ImportError:
     TATC_AVAILABLE = False
     TwoLineElements = None
 
+# Resolve the availability check once at import so guarded calls skip the branch
+if TATC_AVAILABLE:
+
+    def _require_tatc() -> None:
+        """Do nothing; TAT-C was imported successfully."""
+
+else:
+
+    def _require_tatc() -> None:
+        """Raise ImportError because TAT-C could not be imported."""
+        raise ImportError(
+            "TAT-C library is not installed. Install it with: "
+            "pip install git+https://github.com/code-lab-org/tatc.git"
+        )
+
+
+@dataclass
+class GroundTrack:
+    """
+    Ground track stored as parallel per-field arrays.
+
+    Attributes:
+        times: Sample times as a naive UTC datetime64[us] array
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+        alt: Altitudes in meters
+    """
+
+    times: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    alt: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __iter__(self) -> Iterator[Tuple[datetime, float, float, float]]:
+        return iter(self.to_tuples())
+
+    def to_tuples(self) -> List[Tuple[datetime, float, float, float]]:
+        """Return the track as a list of (time, lat_deg, lon_deg, alt_m) tuples."""
+        return list(
+            zip(self.times.tolist(), self.lat.tolist(), self.lon.tolist(), self.alt.tolist())
+        )
+
 
 def _ensure_utc(time: datetime) -> datetime:
     """Convert datetime to UTC timezone-aware."""
-    if time.tzinfo is None:
-        return time.replace(tzinfo=timezone.utc)
-    return time.astimezone(timezone.utc)
+    tz = time.tzinfo
+    if tz is None:
+        return time.replace(tzinfo=_UTC)
+    if tz is _UTC:
+        return time
+    return time.astimezone(_UTC)
+
+
+def _time_offsets(start_time: datetime, end_time: datetime, step_seconds: float) -> np.ndarray:
+    """Return timedelta64[us] offsets from start_time, one per step up to end_time."""
+    # Count in integer microseconds, like timedelta arithmetic, so durations that are exact
+    # multiples of a step with no exact binary value (e.g. 1.1 s) keep their last sample
+    step_us = round(step_seconds * 1e6)
+    total_us = (end_time - start_time) // timedelta(microseconds=1)
+    step_count = total_us // step_us + 1
+    return (np.arange(step_count, dtype=np.int64) * step_us).astype("timedelta64[us]")
 
 
 def _extract_lla(subpoint) -> Tuple[float, float, float]:
@@ -36,6 +109,22 @@ def _extract_lla(subpoint) -> Tuple[float, float, float]:
     )
 
 
+def _geodetic_track(track: Any, times: np.ndarray) -> GroundTrack:
+    """Convert a vectorized Skyfield position into a GroundTrack at datetime64 times."""
+    # One vectorized geodetic conversion for the whole track instead of one per point.
+    # geographic_position_of keeps the satellite altitude as the elevation.
+    position = wgs84.geographic_position_of(track)
+
+    # A single time yields scalars; promote them so every field is indexed per time
+    lat = np.atleast_1d(position.latitude.degrees).astype(np.float64)
+    lon = np.atleast_1d(position.longitude.degrees).astype(np.float64)
+    alt = np.atleast_1d(position.elevation.m).astype(np.float64)
+    if not lat.shape == lon.shape == alt.shape == (len(times),):
+        raise ValueError(f"Propagated {lat.size} positions for {len(times)} times")
+
+    return GroundTrack(times=times, lat=lat, lon=lon, alt=alt)
+
+
 def create_satellite_from_tle(tle_line1: str, tle_line2: str) -> Any:
     """
     Create a satellite object from TLE data using TAT-C.
@@ -51,11 +140,7 @@ def create_satellite_from_tle(tle_line1: str, tle_line2: str) -> Any:
         ImportError: If TAT-C is not installed
         ValueError: If TLE data is invalid
     """
-    if not TATC_AVAILABLE:
-        raise ImportError(
-            "TAT-C library is not installed. Install it with: "
-            "pip install git+https://github.com/code-lab-org/tatc.git"
-        )
+    _require_tatc()
 
     try:
         tle = TwoLineElements(tle=[tle_line1, tle_line2])
@@ -78,14 +163,13 @@ def propagate_satellite(
     Returns:
         Tuple of (latitude_deg, longitude_deg, altitude_m)
     """
-    if not TATC_AVAILABLE:
-        raise ImportError("TAT-C library is not installed")
+    _require_tatc()
 
     try:
         time = _ensure_utc(time)
         track = satellite.get_orbit_track(time)  # Get orbit position at time
-        subpoint = wgs84.subpoint(track)  # Get ground point directly below satellite
-        return _extract_lla(subpoint)
+        position = wgs84.geographic_position_of(track)  # Geodetic position, altitude kept
+        return _extract_lla(position)
     except Exception as e:
         raise ValueError(f"Failed to propagate satellite: {e}")
 
@@ -95,7 +179,7 @@ def generate_ground_track(
     start_time: datetime,
     end_time: datetime,
     step_seconds: float = DEFAULT_STEP_SECONDS,
-) -> List[Tuple[datetime, float, float, float]]:
+) -> GroundTrack:
     """
     Generate ground track for a satellite over a time range.
 
@@ -106,60 +190,63 @@ def generate_ground_track(
         step_seconds: Time step in seconds
 
     Returns:
-        List of tuples: (time, lat_deg, lon_deg, alt_m)
+        GroundTrack with naive UTC times and lat/lon/alt arrays; iterating it yields
+        (time, lat_deg, lon_deg, alt_m) tuples
     """
-    if not TATC_AVAILABLE:
-        raise ImportError("TAT-C library is not installed")
+    _require_tatc()
 
     start_time = _ensure_utc(start_time)
     end_time = _ensure_utc(end_time)
 
-    # Generate time sequence
-    times = []
-    current_time = start_time
-    while current_time <= end_time:
-        times.append(current_time)
-        current_time += timedelta(seconds=step_seconds)
+    # Generate the time sequence as naive UTC datetime64 from whole-step offsets.
+    # TAT-C propagation takes datetimes, so they are only materialized for that call.
+    times64 = np.datetime64(start_time.replace(tzinfo=None), "us") + _time_offsets(
+        start_time, end_time, step_seconds
+    )
+    times = [time.replace(tzinfo=_UTC) for time in times64.tolist()]
 
     # Try batch propagation (faster than individual calls)
     try:
-        track = satellite.get_orbit_track(times)
-
-        # Handle both single object and collection responses
-        try:
-            track_points = list(track)
-        except (TypeError, AttributeError):
-            track_points = [track]
-
-        ground_track = []
-        for i, time in enumerate(times):
-            try:
-                # Use corresponding point or last point if index out of range
-                point = track_points[i] if i < len(track_points) else track_points[-1]
-                subpoint = wgs84.subpoint(point)
-                lat_deg, lon_deg, alt_m = _extract_lla(subpoint)
-
-                # Convert to naive UTC (timezone removed) for compatibility
-                ground_track.append((time.replace(tzinfo=None), lat_deg, lon_deg, alt_m))
-            except Exception as e:
-                print(f"Warning: Failed to extract coordinates at {time}: {e}")
-                continue
-
-        return ground_track
+        return _geodetic_track(satellite.get_orbit_track(times), times64)
+    except Exception as e:
+        logger.warning("Batch propagation failed, retrying with direct SGP4 propagation: %s", e)
 
+    # TAT-C's batch path layers repeat-cycle and multi-TLE handling over SGP4. If that
+    # fails, evaluate the TLE with Skyfield directly, which still propagates every time
+    # step in a single compiled sgp4_array call.
+    try:
+        track = satellite.as_skyfield().at(tatc_constants.timescale.from_datetimes(times))
+        return _geodetic_track(track, times64)
     except Exception as e:
-        # Fallback: propagate one at a time if batch fails
-        print(f"Warning: Batch propagation failed, using individual propagation: {e}")
-        ground_track = []
-        for time in times:
-            try:
-                lat_deg, lon_deg, alt_m = propagate_satellite(satellite, time)
-                ground_track.append((time.replace(tzinfo=None), lat_deg, lon_deg, alt_m))
-            except Exception as e:
-                print(f"Warning: Failed to propagate at {time}: {e}")
-                continue
+        logger.warning("Direct SGP4 propagation failed, using individual propagation: %s", e)
+
+    # Last resort: propagate one at a time, skipping times that fail
+    kept = []
+    positions = []
+    failed = []
+    for i, time in enumerate(times):
+        try:
+            positions.append(propagate_satellite(satellite, time))
+            kept.append(i)
+        except Exception as e:
+            failed.append((time, e))
+            continue
+
+    # Report failures once after the loop rather than logging inside it
+    if failed:
+        first_time, first_error = failed[0]
+        logger.warning(
+            "Failed to propagate %d of %d time steps (first at %s: %s)",
+            len(failed),
+            len(times),
+            first_time,
+            first_error,
+        )
 
-        return ground_track
+    lla = np.array(positions, dtype=np.float64).reshape(-1, 3)
+    return GroundTrack(
+        times=times64[np.array(kept, dtype=np.intp)], lat=lla[:, 0], lon=lla[:, 1], alt=lla[:, 2]
+    )
 
 
 def calculate_footprint(
@@ -178,15 +265,14 @@ def calculate_footprint(
     Returns:
         List of [lon, lat] coordinates forming the footprint polygon, or None if calculation fails
     """
-    if not TATC_AVAILABLE:
-        raise ImportError("TAT-C library is not installed")
+    _require_tatc()
 
     try:
         # Get satellite position first
         lat_deg, lon_deg, alt_m = propagate_satellite(satellite, time)
         return _calculate_circular_footprint(lat_deg, lon_deg, alt_m, fov_degrees)
     except Exception as e:
-        print(f"Warning: Footprint calculation failed: {e}")
+        logger.warning("Footprint calculation failed: %s", e)
         return None
 
 
@@ -211,10 +297,67 @@ def calculate_footprint_from_position(
     try:
         return _calculate_circular_footprint(lat_deg, lon_deg, alt_m, fov_degrees)
     except Exception as e:
-        print(f"Warning: Footprint calculation failed from propagated position: {e}")
+        logger.warning("Footprint calculation failed from propagated position: %s", e)
         return None
 
 
+def _footprint_radius_deg(alt_m: np.ndarray, fov_degrees: float) -> np.ndarray:
+    """Footprint radius in degrees of arc for each altitude (NaN if beyond the horizon)."""
+    fov_rad = math.radians(fov_degrees / 2.0)
+    # Account for satellite altitude in footprint radius calculation
+    with np.errstate(invalid="ignore"):
+        altitude_radius = (
+            np.arcsin((EARTH_RADIUS_M + alt_m) * math.sin(fov_rad) / EARTH_RADIUS_M) - fov_rad
+        )
+    return np.degrees(np.where(alt_m > 0, altitude_radius, fov_rad))
+
+
+def calculate_footprints_batch(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    alts: np.ndarray,
+    fov_degrees: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Calculate circular footprint polygons for many satellite positions at once.
+
+    Args:
+        lats: Satellite latitudes in degrees
+        lons: Satellite longitudes in degrees
+        alts: Satellite altitudes in meters
+        fov_degrees: Field of view in degrees (default: 60 degrees)
+
+    Returns:
+        Array of shape (N, FOOTPRINT_POLYGON_POINTS + 1, 2) holding closed [lon, lat]
+        polygons; footprints that cannot be computed are filled with NaN
+    """
+    if fov_degrees is None:
+        fov_degrees = DEFAULT_FOV_DEGREES
+
+    lats = np.asarray(lats, dtype=np.float64).reshape(-1, 1)
+    lons = np.asarray(lons, dtype=np.float64).reshape(-1, 1)
+    alts = np.asarray(alts, dtype=np.float64).reshape(-1, 1)
+
+    # Calculate lat/lon offsets for every (position, vertex) pair (simplified approximation)
+    radius_deg = _footprint_radius_deg(alts, fov_degrees)
+    dlat = radius_deg * _FOOTPRINT_COS
+    # Longitude scaling is computed once per position rather than divided per vertex;
+    # at the poles it is zeroed so the footprint collapses onto the center longitude.
+    cos_lat = np.cos(np.radians(lats))
+    polar = np.abs(cos_lat) < 1e-6
+    inv_cos_lat = np.where(polar, 0.0, 1.0 / np.where(polar, 1.0, cos_lat))
+    dlon = (radius_deg * inv_cos_lat) * _FOOTPRINT_SIN
+
+    # Normalize coordinates to valid ranges
+    new_lat = np.clip(lats + dlat, -90.0, 90.0)
+    new_lon = np.mod(lons + dlon + 180.0, 360.0) - 180.0
+
+    footprints = np.stack((new_lon, new_lat), axis=-1)
+    # Close each polygon exactly so formatters never need to append a vertex
+    footprints[:, -1] = footprints[:, 0]
+    return footprints
+
+
 def _calculate_circular_footprint(
     lat_deg: float,
     lon_deg: float,
@@ -236,35 +379,9 @@ def _calculate_circular_footprint(
     if fov_degrees is None:
         fov_degrees = DEFAULT_FOV_DEGREES
 
-    # Calculate footprint radius on Earth's surface using geometric approximation
-    fov_rad = math.radians(fov_degrees / 2.0)
-    if alt_m > 0:
-        # Account for satellite altitude in footprint radius calculation
-        footprint_radius_rad = math.asin(
-            (EARTH_RADIUS_M + alt_m) * math.sin(fov_rad) / EARTH_RADIUS_M
-        ) - fov_rad
-    else:
-        footprint_radius_rad = fov_rad
-
-    footprint_radius_deg = math.degrees(footprint_radius_rad)
-
-    # Generate circular polygon by sampling points around the center
-    coords = []
-    for i in range(FOOTPRINT_POLYGON_POINTS + 1):  # +1 to close the polygon
-        angle = 2 * math.pi * i / FOOTPRINT_POLYGON_POINTS
-        # Calculate lat/lon offset (simplified approximation)
-        dlat = footprint_radius_deg * math.cos(angle)
-        cos_lat = math.cos(math.radians(lat_deg))
-        if abs(cos_lat) < 1e-6:
-            dlon = 0.0
-        else:
-            dlon = footprint_radius_deg * math.sin(angle) / cos_lat
-
-        # Normalize coordinates to valid ranges
-        new_lat = max(-90, min(90, lat_deg + dlat))
-        new_lon = ((lon_deg + dlon + 180) % 360) - 180
-
-        coords.append([new_lon, new_lat])
-
-    return coords
-
+    footprint = calculate_footprints_batch([lat_deg], [lon_deg], [alt_m], fov_degrees)[0]
+    if not np.isfinite(footprint).all():
+        raise ValueError(
+            f"Footprint is undefined at altitude {alt_m}m with a {fov_degrees} degree field of view"
+        )
+    return footprint.tolist()
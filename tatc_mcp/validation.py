@@ -3,6 +3,8 @@
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
 
+import numpy as np
+
 
 def validate_norad_id(norad_id: int) -> int:
     """
@@ -17,13 +19,12 @@ def validate_norad_id(norad_id: int) -> int:
     Raises:
         ValueError: If NORAD ID is invalid
     """
-    if not isinstance(norad_id, int):
-        try:
-            norad_id = int(norad_id)
-        except (ValueError, TypeError):
-            raise ValueError(f"NORAD ID must be an integer, got {type(norad_id)}")
+    try:
+        norad_id = int(norad_id)
+    except (ValueError, TypeError):
+        raise ValueError(f"NORAD ID must be an integer, got {type(norad_id)}")
 
-    if norad_id < 1 or norad_id > 99999:
+    if not 1 <= norad_id <= 99999:
         raise ValueError(f"NORAD ID must be between 1 and 99999, got {norad_id}")
 
     return norad_id
@@ -61,11 +62,8 @@ def validate_tle_format(tle_line1: str, tle_line2: str) -> Tuple[str, str]:
     if not tle_line2.startswith("2 "):
         raise ValueError("TLE line 2 must start with '2 '")
 
-    # Basic checksum validation
-    try:
-        checksum1 = int(tle_line1[-1])
-        checksum2 = int(tle_line2[-1])
-    except ValueError:
+    # Basic checksum validation: compare characters directly instead of parsing with int()
+    if not ("0" <= tle_line1[-1] <= "9" and "0" <= tle_line2[-1] <= "9"):
         raise ValueError("TLE checksums must be digits")
 
     return tle_line1, tle_line2
@@ -135,11 +133,10 @@ def validate_step_interval(
     Raises:
         ValueError: If step interval is invalid
     """
-    if not isinstance(step_seconds, (int, float)):
-        try:
-            step_seconds = float(step_seconds)
-        except (ValueError, TypeError):
-            raise ValueError(f"step_seconds must be a number, got {type(step_seconds)}")
+    try:
+        step_seconds = float(step_seconds)
+    except (ValueError, TypeError):
+        raise ValueError(f"step_seconds must be a number, got {type(step_seconds)}")
 
     if step_seconds < min_step:
         raise ValueError(f"Step interval {step_seconds}s is too small (minimum {min_step}s)")
@@ -147,7 +144,7 @@ def validate_step_interval(
     if step_seconds > max_step:
         raise ValueError(f"Step interval {step_seconds}s is too large (maximum {max_step}s)")
 
-    return float(step_seconds)
+    return step_seconds
 
 
 def validate_coordinates(lat_deg: float, lon_deg: float) -> Tuple[float, float]:
@@ -164,21 +161,57 @@ def validate_coordinates(lat_deg: float, lon_deg: float) -> Tuple[float, float]:
     Raises:
         ValueError: If coordinates are out of valid range
     """
-    if not isinstance(lat_deg, (int, float)):
-        raise ValueError(f"Latitude must be a number, got {type(lat_deg)}")
+    try:
+        lat = float(lat_deg)
+        lon = float(lon_deg)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Latitude and longitude must be numbers, got {type(lat_deg)} and {type(lon_deg)}"
+        )
+
+    if not -90.0 <= lat <= 90.0:
+        raise ValueError(f"Latitude {lat} is out of valid range [-90, 90]")
+
+    # Normalize longitude to [-180, 180]; in-range values (including 180) are kept as is
+    if not -180.0 <= lon <= 180.0:
+        lon = ((lon + 180.0) % 360.0) - 180.0
+
+    return lat, lon
+
+
+def validate_coordinates_array(lat_deg, lon_deg) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate and normalize arrays of coordinates in one vectorized pass.
 
-    if not isinstance(lon_deg, (int, float)):
-        raise ValueError(f"Longitude must be a number, got {type(lon_deg)}")
+    Args:
+        lat_deg: Array-like of latitudes in degrees
+        lon_deg: Array-like of longitudes in degrees
 
-    lat_deg = float(lat_deg)
-    lon_deg = float(lon_deg)
+    Returns:
+        Tuple of (validated_lat, validated_lon) float64 arrays
 
-    if not (-90 <= lat_deg <= 90):
-        raise ValueError(f"Latitude {lat_deg} is out of valid range [-90, 90]")
+    Raises:
+        ValueError: If any coordinate is non-numeric or a latitude is out of range
+    """
+    try:
+        lat_deg = np.asarray(lat_deg, dtype=np.float64)
+        lon_deg = np.asarray(lon_deg, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Coordinates must be numbers")
+
+    # Written as a negated range check so NaN latitudes are rejected like the scalar path
+    bad = ~((lat_deg >= -90) & (lat_deg <= 90))
+    if bad.any():
+        first_bad = lat_deg[bad][0]
+        raise ValueError(
+            f"{int(bad.sum())} latitude(s) out of valid range [-90, 90], e.g. {first_bad}"
+        )
 
-    # Normalize longitude to [-180, 180]
-    if lon_deg < -180 or lon_deg > 180:
-        lon_deg = ((lon_deg + 180) % 360) - 180
+    # Normalize longitude to [-180, 180]. The modulo is only applied to out-of-range
+    # values: applied unconditionally it would map 180 to -180 and perturb values near 0.
+    out_of_range = (lon_deg < -180) | (lon_deg > 180)
+    if out_of_range.any():
+        lon_deg = np.where(out_of_range, np.mod(lon_deg + 180, 360) - 180, lon_deg)
 
     return lat_deg, lon_deg
 
@@ -202,11 +235,11 @@ def validate_altitude(
     Raises:
         ValueError: If altitude is out of valid range
     """
-    if not isinstance(alt_m, (int, float)):
+    try:
+        alt_m = float(alt_m)
+    except (TypeError, ValueError):
         raise ValueError(f"Altitude must be a number, got {type(alt_m)}")
 
-    alt_m = float(alt_m)
-
     if min_alt is not None and alt_m < min_alt:
         raise ValueError(f"Altitude {alt_m}m is below minimum {min_alt}m")
 